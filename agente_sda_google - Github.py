@@ -15,6 +15,11 @@ Ele realiza as seguintes etapas:
 
 Este processo é executado em loop, com um intervalo configurável entre os posts.
 
+Os logs são emitidos pelo módulo `logging` com níveis, um ID de correlação por post
+e escrita em uma thread em segundo plano (QueueHandler/QueueListener). O nível e um
+arquivo de log rotativo opcional são controlados pelas variáveis de ambiente
+SDA_LOG_LEVEL e SDA_LOG_FILE.
+
 Principais dependências:
 - google-generativeai (para API Gemini e ADK)
 - google-api-python-client (para Google Drive e Sheets)
@@ -30,20 +35,220 @@ Data da Última Modificação: 17 de Maio de 2025
 
 # --- IMPORTAÇÕES DE MÓDULOS ---
 import os
+import sys
 import time
 from datetime import datetime
 from io import BytesIO
 import json
 import random
-import traceback # Para logs de erro detalhados
+import uuid
+import queue
+import atexit
+import contextvars
+import logging
+import logging.handlers
+
+# --- CONFIGURAÇÃO DE LOGGING ---
+# Configurado antes das demais importações para que as mensagens de inicialização já passem pela fila.
+LOG_LEVEL = os.environ.get("SDA_LOG_LEVEL", "INFO").upper()
+LOG_FILE = os.environ.get("SDA_LOG_FILE")            # Opcional: também grava em um arquivo rotativo
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+LOG_QUEUE_MAX_REGISTROS = 10000                      # Acima disso, novos registros são descartados (nunca bloqueia)
+LOG_TAXA_AMOSTRAGEM_PAYLOAD = 0.1                    # Fração dos posts cujos textos completos (frase/prompt) vão para o DEBUG
+LOG_TAMANHO_PREVIA_PAYLOAD = 50                      # Caracteres dos textos gerados exibidos nas prévias
+LOG_TIMEOUT_ENCERRAMENTO_SEGUNDOS = 5                # Espera máxima pela thread de escrita ao encerrar o script
+
+log = logging.getLogger("agente_sda")
+
+# Estado do post em processamento, lido pelo filtro de correlação a cada registro.
+_post_id_atual = contextvars.ContextVar("post_id", default="-")
+_post_amostrado = contextvars.ContextVar("post_amostrado", default=False)
+
+
+class _PostIdFilter(logging.Filter):
+    """Anexa o ID de correlação do post atual (`post_id`) a cada registro de log."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.post_id = _post_id_atual.get()
+        return True
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que nunca bloqueia a etapa que está logando.
+
+    A formatação fica para a thread do QueueListener e, se a fila estiver cheia (coletor de
+    logs lento), o registro é descartado e contabilizado em vez de esperar.
+    """
+
+    _formatter_traceback = logging.Formatter()
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        # Contador apenas crescente; a thread de escrita reporta a diferença desde o último aviso.
+        self.registros_descartados = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Ao contrário do QueueHandler padrão, não junta `msg % args` aqui: a mensagem é formatada
+        depois, na thread de escrita. Por isso os `args` dos logs do script devem ser imutáveis
+        (str, int, exceções já capturadas), nunca objetos que a etapa ainda vá alterar.
+        O traceback, quando existe, é renderizado já aqui para não manter os frames vivos na fila.
+        """
+        if record.exc_info:
+            record.exc_text = self._formatter_traceback.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.registros_descartados += 1
+
+
+class _QueueListenerComTimeout(logging.handlers.QueueListener):
+    """
+    QueueListener que, na própria thread de escrita, avisa quantos registros foram descartados
+    assim que a fila volta a andar. Seu encerramento nunca trava o processo: se a fila continuar
+    cheia ou a thread estiver presa em um stdout bloqueado, desiste após LOG_TIMEOUT_ENCERRAMENTO_SEGUNDOS.
+    """
+
+    def __init__(self, queue_handler: _NonBlockingQueueHandler, *handlers, respect_handler_level: bool = False):
+        super().__init__(queue_handler.queue, *handlers, respect_handler_level=respect_handler_level)
+        self._queue_handler = queue_handler
+        self._descartados_reportados = 0
+
+    def descartados_nao_reportados(self) -> int:
+        """Retorna quantos registros foram descartados desde o último aviso escrito."""
+        return self._queue_handler.registros_descartados - self._descartados_reportados
+
+    def emitir_aviso_descartados(self, quantidade: int, post_id: str):
+        """Escreve o aviso de registros descartados direto nos handlers de saída, sem passar pela fila."""
+        aviso = logging.LogRecord(
+            log.name, logging.WARNING, "", 0,
+            "⚠️ %d registros de log descartados por fila cheia.", (quantidade,), None, func="QueueListener"
+        )
+        aviso.post_id = post_id
+        super().handle(aviso)
+        # Só conta como reportado depois de escrito; se a escrita travar, o encerramento ainda os informa.
+        self._descartados_reportados += quantidade
+
+    def handle(self, record: logging.LogRecord):
+        novos_descartados = self.descartados_nao_reportados()
+        if novos_descartados:
+            self.emitir_aviso_descartados(novos_descartados, record.post_id)
+        super().handle(record)
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel, timeout=LOG_TIMEOUT_ENCERRAMENTO_SEGUNDOS)
+
+    def stop(self) -> bool:
+        """Para a thread de escrita. Retorna False se ela não terminou dentro do tempo limite."""
+        writer_thread, self._thread = self._thread, None
+        try:
+            self.enqueue_sentinel()
+        except queue.Full:
+            sys.stderr.write("[agente_sda] Fila de logs ainda cheia ao encerrar; registros pendentes foram descartados.\n")
+            return False
+        writer_thread.join(timeout=LOG_TIMEOUT_ENCERRAMENTO_SEGUNDOS)
+        return not writer_thread.is_alive()
+
+
+def _resolver_nivel_log(nome_nivel: str) -> int | None:
+    """Converte o valor de SDA_LOG_LEVEL (nome como 'DEBUG' ou número como '10') em um nível de logging, ou None se inválido."""
+    if nome_nivel.isdigit():
+        return int(nome_nivel)
+    nivel = logging.getLevelName(nome_nivel)
+    return nivel if isinstance(nivel, int) else None
+
+
+def configurar_logging() -> _QueueListenerComTimeout:
+    """
+    Configura o logger do script: as etapas apenas enfileiram registros e um QueueListener
+    os escreve no stdout (e, opcionalmente, em arquivo rotativo) a partir de uma thread própria.
+
+    Returns:
+        O QueueListener já iniciado; ele é parado automaticamente ao final do processo.
+    """
+    log_formatter = logging.Formatter(
+        "%(asctime)s %(levelname)-8s [post=%(post_id)s] %(funcName)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
+    )
+    output_handlers = [logging.StreamHandler(sys.stdout)]
+    if LOG_FILE:
+        output_handlers.append(logging.handlers.RotatingFileHandler(
+            LOG_FILE, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT, encoding="utf-8"
+        ))
+    for output_handler in output_handlers:
+        output_handler.setFormatter(log_formatter)
+
+    queue_handler = _NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_MAX_REGISTROS))
+    queue_handler.addFilter(_PostIdFilter())
+
+    nivel_log = _resolver_nivel_log(LOG_LEVEL)
+    log.setLevel(nivel_log if nivel_log is not None else logging.INFO)
+    log.addHandler(queue_handler)
+    log.propagate = False
+
+    queue_listener = _QueueListenerComTimeout(queue_handler, *output_handlers, respect_handler_level=True)
+    queue_listener.start()
+
+    def _finalizar_logging():
+        escrita_concluida = queue_listener.stop()
+        descartados_pendentes = queue_listener.descartados_nao_reportados()
+        # Com a thread de escrita presa em um write, o lock do StreamHandler continua preso e o
+        # logging.shutdown() padrão travaria o encerramento; nesse caso os handlers não são finalizados
+        # e os descartes pendentes vão para o stderr, já fora do loop de posts.
+        if escrita_concluida:
+            if descartados_pendentes:
+                queue_listener.emitir_aviso_descartados(descartados_pendentes, _post_id_atual.get())
+            logging.shutdown()
+        elif descartados_pendentes:
+            sys.stderr.write(f"[agente_sda] {descartados_pendentes} registros de log descartados por fila cheia.\n")
+
+    atexit.unregister(logging.shutdown)
+    atexit.register(_finalizar_logging)
+
+    if nivel_log is None:
+        log.warning("⚠️ SDA_LOG_LEVEL inválido ('%s'). Usando INFO.", LOG_LEVEL)
+    return queue_listener
+
+
+def _previa(texto: str, limite: int = LOG_TAMANHO_PREVIA_PAYLOAD) -> str:
+    """Retorna o texto em uma única linha, truncado em `limite` caracteres."""
+    texto_linha_unica = " ".join(texto.split())
+    return (texto_linha_unica[:limite - 3] + "...") if len(texto_linha_unica) > limite else texto_linha_unica
+
+
+def log_payload(rotulo: str, texto: str):
+    """
+    Loga um texto gerado pela IA (frase, prompt de imagem etc.) no nível DEBUG de forma econômica:
+    o texto completo apenas nos posts amostrados e, nos demais, só uma prévia curta.
+    """
+    if not texto or not log.isEnabledFor(logging.DEBUG):
+        return
+    if _post_amostrado.get():
+        log.debug("%s (completo):\n%s", rotulo, texto, stacklevel=2)
+    else:
+        log.debug("%s (%d caracteres): '%s'", rotulo, len(texto), _previa(texto), stacklevel=2)
+
+
+def _com_traceback() -> bool:
+    """Tracebacks completos de erros recuperáveis só são registrados com o nível DEBUG habilitado."""
+    return log.isEnabledFor(logging.DEBUG)
+
+
+configurar_logging()
 
 # Bibliotecas Google e IA Generativa
 try:
     from google import genai as google_genai_for_client 
     import google.generativeai as genai_sdk_main 
-    print("[INFO] SDK Gemini: Usando 'from google import genai' e 'import google.generativeai'.")
+    log.info("SDK Gemini: Usando 'from google import genai' e 'import google.generativeai'.")
 except ImportError:
-    print("[WARN] SDK Gemini: Tentando importação alternativa 'import google.generativeai'.")
+    log.warning("SDK Gemini: Tentando importação alternativa 'import google.generativeai'.")
     import google.generativeai as google_genai_for_client
     genai_sdk_main = google_genai_for_client
 
@@ -63,9 +268,7 @@ from PIL import Image
 import gspread 
 import pytz 
 
-print("----------------------------------------------------")
-print("[INFO] Todas as bibliotecas principais foram importadas.")
-print("----------------------------------------------------")
+log.info("Todas as bibliotecas principais foram importadas.")
 # --- CONFIGURAÇÕES GLOBAIS E CONSTANTES ---
 # ATENÇÃO: NUNCA coloque chaves de API diretamente no código em um ambiente de produção ou ao compartilhar.
 #          Use variáveis de ambiente ou um sistema de gerenciamento de segredos.
@@ -84,7 +287,7 @@ QUALIDADE_JPEG = 90
 GEMINI_MODEL_FOR_ADK_AGENTS = "gemini-2.0-flash" 
 MODELO_GEMINI_PARA_IMAGEM = "gemini-2.0-flash-preview-image-generation"
 
-print("[INFO] Configurações globais carregadas.")
+log.info("Configurações globais carregadas.")
 
 # --- INICIALIZAÇÃO E CONFIGURAÇÃO DE SERVIÇOS ---
 CLIENT_EMAIL_FROM_JSON = None 
@@ -94,17 +297,16 @@ try:
         CLIENT_EMAIL_FROM_JSON = creds_json_data.get('client_email')
     
     genai_sdk_main.configure(api_key=GOOGLE_GEMINI_API_KEY)
-    print(f"✅ [OKAY] SDK Gemini (genai.configure) inicializado com sucesso (Chave API final: ...{GOOGLE_GEMINI_API_KEY[-4:] if GOOGLE_GEMINI_API_KEY else 'N/A'}).")
+    log.info("✅ SDK Gemini (genai.configure) inicializado com sucesso (Chave API final: ...%s).", GOOGLE_GEMINI_API_KEY[-4:] if GOOGLE_GEMINI_API_KEY else 'N/A')
     
     os.environ["GOOGLE_API_KEY"] = GOOGLE_GEMINI_API_KEY
-    print(f"ℹ️ [INFO] Variável de ambiente GOOGLE_API_KEY definida.")
+    log.info("ℹ️ Variável de ambiente GOOGLE_API_KEY definida.")
 
 except FileNotFoundError:
-    print(f"❌ [FATAL] Arquivo de credenciais da conta de serviço '{GOOGLE_SERVICE_ACCOUNT_FILE}' não encontrado. O script não pode continuar.")
+    log.critical("❌ Arquivo de credenciais da conta de serviço '%s' não encontrado. O script não pode continuar.", GOOGLE_SERVICE_ACCOUNT_FILE)
     exit(1) 
 except Exception as e:
-    print(f"❌ [FATAL] Falha ao configurar o SDK Gemini ou ler o arquivo de credenciais: {e}")
-    traceback.print_exc()
+    log.critical("❌ Falha ao configurar o SDK Gemini ou ler o arquivo de credenciais: %s", e, exc_info=True)
     exit(1)
 
 SCOPES_GOOGLE_APIS = [
@@ -116,10 +318,10 @@ gsheets_worksheet = None
 gdrive_service = None
 
 if not SPREADSHEET_ID or SPREADSHEET_ID == "TODO_SPREADSHEET_ID_AQUI": 
-    print("❌ [FATAL] O ID da Planilha (SPREADSHEET_ID) não foi configurado corretamente. Verifique as CONFIGURAÇÕES GLOBAIS.")
+    log.critical("❌ O ID da Planilha (SPREADSHEET_ID) não foi configurado corretamente. Verifique as CONFIGURAÇÕES GLOBAIS.")
     exit(1)
 if not DRIVE_FOLDER_ID or DRIVE_FOLDER_ID == "TODO_DRIVE_FOLDER_ID_AQUI":
-    print("❌ [FATAL] O ID da Pasta do Drive (DRIVE_FOLDER_ID) não foi configurado corretamente. Verifique as CONFIGURAÇÕES GLOBAIS.")
+    log.critical("❌ O ID da Pasta do Drive (DRIVE_FOLDER_ID) não foi configurado corretamente. Verifique as CONFIGURAÇÕES GLOBAIS.")
     exit(1)
 
 try:
@@ -128,34 +330,31 @@ try:
     gspread_client = gspread.authorize(google_api_creds)
     gs_spreadsheet = gspread_client.open_by_key(SPREADSHEET_ID)
     gsheets_worksheet = gs_spreadsheet.sheet1 
-    print(f"✅ [OKAY] Google Sheets: Conectado à planilha '{gs_spreadsheet.title}' (Aba: '{gsheets_worksheet.title}')")
+    log.info("✅ Google Sheets: Conectado à planilha '%s' (Aba: '%s')", gs_spreadsheet.title, gsheets_worksheet.title)
     
     gdrive_service = build("drive", "v3", credentials=google_api_creds)
-    print("✅ [OKAY] Google Drive API: Serviço inicializado.")
+    log.info("✅ Google Drive API: Serviço inicializado.")
     
-    print(f"ℹ️ [INFO] Autenticação Google: Usando conta de serviço '{CLIENT_EMAIL_FROM_JSON or 'Email não lido do JSON'}'.")
-    print(f"ℹ️ [INFO]      -> Certifique-se que esta conta tem permissão de 'Editor' na Planilha e na Pasta do Drive ({DRIVE_FOLDER_ID}).")
+    log.info("ℹ️ Autenticação Google: Usando conta de serviço '%s'.", CLIENT_EMAIL_FROM_JSON or 'Email não lido do JSON')
+    log.info("ℹ️      -> Certifique-se que esta conta tem permissão de 'Editor' na Planilha e na Pasta do Drive (%s).", DRIVE_FOLDER_ID)
 
 except gspread.exceptions.SpreadsheetNotFound:
-    print(f"❌ [FATAL] Google Sheets: Planilha com ID '{SPREADSHEET_ID}' não encontrada ou não acessível pela conta de serviço '{CLIENT_EMAIL_FROM_JSON}'.")
+    log.critical("❌ Google Sheets: Planilha com ID '%s' não encontrada ou não acessível pela conta de serviço '%s'.", SPREADSHEET_ID, CLIENT_EMAIL_FROM_JSON)
     exit(1)
 except Exception as e:
-    print(f"❌ [FATAL] Erro crítico durante a inicialização dos serviços Google (Sheets/Drive): {e}")
-    traceback.print_exc()
+    log.critical("❌ Erro crítico durante a inicialização dos serviços Google (Sheets/Drive): %s", e, exc_info=True)
     exit(1)
 
 gemini_image_generation_client = None
 try:
     gemini_image_generation_client = google_genai_for_client.Client()
-    print(f"✅ [OKAY] Cliente Gemini para Geração de Imagem (`genai.Client()`) inicializado.")
+    log.info("✅ Cliente Gemini para Geração de Imagem (`genai.Client()`) inicializado.")
 except AttributeError:
-    print("❌ [FATAL] Cliente Gemini (`google.genai.Client()`) não encontrado. Verifique a importação e a versão da biblioteca 'google-generativeai'.")
+    log.critical("❌ Cliente Gemini (`google.genai.Client()`) não encontrado. Verifique a importação e a versão da biblioteca 'google-generativeai'.")
     exit(1)
 except Exception as e:
-    print(f"❌ [FATAL] Erro ao inicializar o cliente Gemini para geração de imagem: {e}")
-    traceback.print_exc()
+    log.critical("❌ Erro ao inicializar o cliente Gemini para geração de imagem: %s", e, exc_info=True)
     exit(1)
-print("----------------------------------------------------")
 
 # --- DEFINIÇÕES DE FUNÇÕES AUXILIARES ---
 
@@ -171,7 +370,7 @@ def call_agent_sync(agent: Agent, input_message: str) -> str:
         A resposta textual do agente, ou uma string vazia em caso de erro.
     """
     if not agent or not input_message:
-        print(" कॉल [ERROR] call_agent_sync: Agente ou mensagem de entrada inválidos.")
+        log.error("Agente ou mensagem de entrada inválidos.")
         return ""
 
     session_svc = InMemorySessionService()
@@ -179,7 +378,7 @@ def call_agent_sync(agent: Agent, input_message: str) -> str:
     user_context_id = "user_main_script" 
 
     try:
-        print(f"⚙️ [DEBUG] call_agent_sync: Criando sessão '{session_unique_id}' para o agente '{agent.name}'...")
+        log.debug("⚙️ Criando sessão '%s' para o agente '%s'...", session_unique_id, agent.name)
         _ = session_svc.create_session(
             app_name=agent.name, 
             user_id=user_context_id, 
@@ -193,7 +392,7 @@ def call_agent_sync(agent: Agent, input_message: str) -> str:
             parts=[genai_adk_types.Part(text=input_message)]
         )
         
-        print(f"🏃 [DEBUG] call_agent_sync: Executando agente '{agent.name}' com sessão '{session_unique_id}'...")
+        log.debug("🏃 Executando agente '%s' com sessão '%s'...", agent.name, session_unique_id)
         final_agent_response = ""
         for event in adk_runner.run(user_id=user_context_id, session_id=session_unique_id, new_message=input_content):
             if event.is_final_response():
@@ -203,12 +402,11 @@ def call_agent_sync(agent: Agent, input_message: str) -> str:
         
         response_trimmed = final_agent_response.strip()
         if not response_trimmed:
-            print(f"⚠️ [WARN] call_agent_sync: Agente '{agent.name}' retornou uma resposta vazia.")
+            log.warning("⚠️ Agente '%s' retornou uma resposta vazia.", agent.name)
         return response_trimmed
 
     except Exception as e:
-        print(f"❌ [ERROR] call_agent_sync: Falha ao executar o agente '{agent.name}'. Sessão: '{session_unique_id}'. Erro: {e}")
-        traceback.print_exc()
+        log.error("❌ Falha ao executar o agente '%s'. Sessão: '%s'. Erro: %s", agent.name, session_unique_id, e, exc_info=_com_traceback())
         return ""
 
 
@@ -223,13 +421,13 @@ def generate_image_with_gemini_client(image_prompt: str) -> bytes | None:
         Bytes da imagem em formato JPEG, ou None em caso de falha.
     """
     if not gemini_image_generation_client:
-        print("❌ [ERROR] generate_image_with_gemini_client: Cliente Gemini para imagem não inicializado.")
+        log.error("❌ Cliente Gemini para imagem não inicializado.")
         return None
     if not image_prompt or not image_prompt.strip():
-        print("❌ [ERROR] generate_image_with_gemini_client: Prompt para imagem está vazio.")
+        log.error("❌ Prompt para imagem está vazio.")
         return None
 
-    print(f"🖼️ [INFO] generate_image_with_gemini_client: Solicitando imagem com prompt:\n--- Prompt Imagem ---\n{image_prompt}\n---------------------")
+    log_payload("🖼️ Solicitando imagem com prompt", image_prompt)
     
     final_jpeg_image_bytes = None
 
@@ -237,7 +435,7 @@ def generate_image_with_gemini_client(image_prompt: str) -> bytes | None:
         image_gen_config = genai_types_for_api.GenerateContentConfig(
             response_modalities=['IMAGE', 'TEXT'] 
         )
-        print("⚙️ [DEBUG] generate_image_with_gemini_client: Usando config com response_modalities=['IMAGE', 'TEXT']")
+        log.debug("⚙️ Usando config com response_modalities=['IMAGE', 'TEXT']")
 
         api_response = gemini_image_generation_client.models.generate_content(
             model=MODELO_GEMINI_PARA_IMAGEM,
@@ -258,23 +456,23 @@ def generate_image_with_gemini_client(image_prompt: str) -> bytes | None:
                    part.inline_data.mime_type.startswith("image/"):
                     raw_image_bytes = part.inline_data.data
                     original_image_mime_type = part.inline_data.mime_type
-                    print(f"⚙️ [DEBUG] generate_image_with_gemini_client: Imagem recebida da API. MIME Type original: {original_image_mime_type}.")
+                    log.debug("⚙️ Imagem recebida da API. MIME Type original: %s.", original_image_mime_type)
         
         if accompanying_text.strip():
-            print(f"ℹ️ [INFO] generate_image_with_gemini_client: Texto acompanhando a imagem (da API): {accompanying_text.strip()}")
+            log_payload("ℹ️ Texto acompanhando a imagem (da API)", accompanying_text.strip())
 
         if raw_image_bytes:
             if original_image_mime_type == "image/jpeg":
-                print("ℹ️ [INFO] generate_image_with_gemini_client: Imagem da API já está em formato JPEG.")
+                log.debug("ℹ️ Imagem da API já está em formato JPEG.")
                 final_jpeg_image_bytes = raw_image_bytes
             elif original_image_mime_type == "image/png":
-                print("ℹ️ [INFO] generate_image_with_gemini_client: Convertendo imagem de PNG para JPEG...")
+                log.debug("ℹ️ Convertendo imagem de PNG para JPEG...")
                 try:
                     pil_image = Image.open(BytesIO(raw_image_bytes))
                     
                     if pil_image.mode == 'RGBA' or pil_image.mode == 'LA' or \
                        (pil_image.mode == 'P' and 'transparency' in pil_image.info):
-                        print("⚙️ [DEBUG] generate_image_with_gemini_client: Imagem PNG com canal alfa detectado. Aplicando fundo branco.")
+                        log.debug("⚙️ Imagem PNG com canal alfa detectado. Aplicando fundo branco.")
                         background_fill = Image.new('RGB', pil_image.size, (255, 255, 255))
                         alpha_mask = None
                         if pil_image.mode == 'RGBA': alpha_mask = pil_image.split()[3]
@@ -282,33 +480,31 @@ def generate_image_with_gemini_client(image_prompt: str) -> bytes | None:
                         
                         if alpha_mask: background_fill.paste(pil_image, mask=alpha_mask)
                         else: 
-                            print("⚠️ [WARN] generate_image_with_gemini_client: Não foi possível extrair máscara alfa clara para PNG modo 'P', convertendo para RGB diretamente.")
+                            log.warning("⚠️ Não foi possível extrair máscara alfa clara para PNG modo 'P', convertendo para RGB diretamente.")
                             pil_image = pil_image.convert('RGB') 
                             background_fill.paste(pil_image)
                         pil_image = background_fill
                     elif pil_image.mode != 'RGB': 
-                        print(f"⚙️ [DEBUG] generate_image_with_gemini_client: Convertendo imagem de modo {pil_image.mode} para RGB.")
+                        log.debug("⚙️ Convertendo imagem de modo %s para RGB.", pil_image.mode)
                         pil_image = pil_image.convert('RGB')
 
                     with BytesIO() as jpeg_buffer:
                         pil_image.save(jpeg_buffer, format='JPEG', quality=QUALIDADE_JPEG)
                         final_jpeg_image_bytes = jpeg_buffer.getvalue()
-                    print(f"✅ [OKAY] generate_image_with_gemini_client: Imagem convertida para JPEG com sucesso (Qualidade: {QUALIDADE_JPEG}).")
+                    log.debug("✅ Imagem convertida para JPEG com sucesso (Qualidade: %d).", QUALIDADE_JPEG)
                 except Exception as e_conversion:
-                    print(f"❌ [ERROR] generate_image_with_gemini_client: Falha ao converter imagem de PNG para JPEG: {e_conversion}")
-                    traceback.print_exc()
+                    log.error("❌ Falha ao converter imagem de PNG para JPEG: %s", e_conversion, exc_info=_com_traceback())
                     final_jpeg_image_bytes = None 
             else:
-                print(f"⚠️ [WARN] generate_image_with_gemini_client: Formato de imagem não JPEG/PNG recebido ({original_image_mime_type}). Não foi feita conversão. Bytes da imagem serão descartados.")
+                log.warning("⚠️ Formato de imagem não JPEG/PNG recebido (%s). Não foi feita conversão. Bytes da imagem serão descartados.", original_image_mime_type)
                 final_jpeg_image_bytes = None # Descarta se não for formato conhecido/conversível
         else:
-            print("❌ [ERROR] generate_image_with_gemini_client: Nenhuma imagem foi encontrada na resposta da API Gemini.")
+            log.error("❌ Nenhuma imagem foi encontrada na resposta da API Gemini.")
         
         return final_jpeg_image_bytes
 
     except Exception as e_general:
-        print(f"❌ [ERROR] generate_image_with_gemini_client: Erro geral durante a geração da imagem (Modelo: {MODELO_GEMINI_PARA_IMAGEM}). Erro: {e_general}")
-        traceback.print_exc()
+        log.error("❌ Erro geral durante a geração da imagem (Modelo: %s). Erro: %s", MODELO_GEMINI_PARA_IMAGEM, e_general, exc_info=_com_traceback())
         return None
 
 
@@ -317,10 +513,10 @@ def upload_image_to_google_drive(gdrive_api_service, filename_on_drive: str, ima
     Faz upload de bytes de uma imagem para uma pasta específica no Google Drive.
     """
     if not gdrive_api_service or not filename_on_drive or not image_bytes_to_upload or not target_folder_id:
-        print("❌ [ERROR] upload_image_to_google_drive: Parâmetros inválidos.")
+        log.error("❌ Parâmetros inválidos.")
         return None, None, None
 
-    print(f"💾 [INFO] upload_image_to_google_drive: Fazendo upload do arquivo '{filename_on_drive}' para a pasta '{target_folder_id}'...")
+    log.debug("💾 Fazendo upload do arquivo '%s' para a pasta '%s'...", filename_on_drive, target_folder_id)
     try:
         media_uploader = MediaIoBaseUpload(
             BytesIO(image_bytes_to_upload), 
@@ -341,17 +537,16 @@ def upload_image_to_google_drive(gdrive_api_service, filename_on_drive: str, ima
         
         if file_id_on_drive:
             direct_download_url = f"https://drive.google.com/uc?export=download&id={file_id_on_drive}"
-            print(f"✅ [OKAY] upload_image_to_google_drive: Arquivo '{filename_on_drive}' carregado. ID: {file_id_on_drive}.")
-            print(f"       -> Link de Visualização: {web_view_link_drive}")
-            print(f"       -> Link de Download Direto: {direct_download_url}")
+            log.debug("✅ Arquivo '%s' carregado. ID: %s.", filename_on_drive, file_id_on_drive)
+            log.debug("       -> Link de Visualização: %s", web_view_link_drive)
+            log.debug("       -> Link de Download Direto: %s", direct_download_url)
             return web_view_link_drive, direct_download_url, file_id_on_drive
         else:
-            print(f"❌ [ERROR] upload_image_to_google_drive: Upload do arquivo '{filename_on_drive}' sem retorno de ID.")
+            log.error("❌ Upload do arquivo '%s' sem retorno de ID.", filename_on_drive)
             return web_view_link_drive, None, None
 
     except Exception as e:
-        print(f"❌ [ERROR] upload_image_to_google_drive: Falha ao fazer upload do arquivo '{filename_on_drive}'. Erro: {e}")
-        traceback.print_exc()
+        log.error("❌ Falha ao fazer upload do arquivo '%s'. Erro: %s", filename_on_drive, e, exc_info=_com_traceback())
         return None, None, None
 
 
@@ -360,18 +555,17 @@ def set_google_drive_file_public_readable(gdrive_api_service, file_id_on_drive:
     Define as permissões de um arquivo no Google Drive para "qualquer pessoa com o link pode ler".
     """
     if not gdrive_api_service or not file_id_on_drive:
-        print("❌ [ERROR] set_google_drive_file_public_readable: Serviço do Drive ou ID do arquivo não fornecido.")
+        log.error("❌ Serviço do Drive ou ID do arquivo não fornecido.")
         return False
         
-    print(f"🔒 [INFO] set_google_drive_file_public_readable: Definindo permissões públicas para o arquivo ID: {file_id_on_drive}...")
+    log.debug("🔒 Definindo permissões públicas para o arquivo ID: %s...", file_id_on_drive)
     try:
         public_permission_settings = {'type': 'anyone', 'role': 'reader'}
         gdrive_api_service.permissions().create(fileId=file_id_on_drive, body=public_permission_settings).execute()
-        print(f"✅ [OKAY] set_google_drive_file_public_readable: Permissões do arquivo '{file_id_on_drive}' definidas.")
+        log.debug("✅ Permissões do arquivo '%s' definidas.", file_id_on_drive)
         return True
     except Exception as e:
-        print(f"❌ [ERROR] set_google_drive_file_public_readable: Falha ao definir permissões para o arquivo '{file_id_on_drive}'. Erro: {e}")
-        traceback.print_exc()
+        log.error("❌ Falha ao definir permissões para o arquivo '%s'. Erro: %s", file_id_on_drive, e, exc_info=_com_traceback())
         return False
 
 
@@ -380,23 +574,19 @@ def save_data_to_google_sheet(gs_worksheet_instance, timestamp_str: str, post_te
     Salva os dados de um post em uma nova linha na planilha Google.
     """
     if not gs_worksheet_instance:
-        print("❌ [ERROR] save_data_to_google_sheet: Instância da planilha não fornecida.")
+        log.error("❌ Instância da planilha não fornecida.")
         return
 
-    print(f"📊 [INFO] save_data_to_google_sheet: Registrando dados na planilha...")
+    log.debug("📊 Registrando dados na planilha...")
     try:
         text_for_sheet = post_text if post_text and post_text.strip() else "ERRO: Texto do post não gerado ou vazio"
         url_or_status_for_sheet = image_url_or_status if image_url_or_status and image_url_or_status.strip() else "ERRO: URL/Status da imagem não disponível"
         
         new_row_data = [timestamp_str, text_for_sheet, url_or_status_for_sheet]
         gs_worksheet_instance.append_row(new_row_data)
-        # Para o log, mostrar apenas uma prévia do texto e da URL para não poluir.
-        log_text_preview = (text_for_sheet[:47] + "...") if len(text_for_sheet) > 50 else text_for_sheet
-        log_url_preview = (url_or_status_for_sheet[:50] + "...") if len(url_or_status_for_sheet) > 50 else url_or_status_for_sheet
-        print(f"✅ [OKAY] save_data_to_google_sheet: Dados salvos: {new_row_data[0]}, '{log_text_preview}', '{log_url_preview}'")
+        log.debug("✅ Dados salvos na linha do post de %s.", new_row_data[0])
     except Exception as e:
-        print(f"❌ [ERROR] save_data_to_google_sheet: Falha ao salvar dados na planilha. Erro: {e}")
-        traceback.print_exc()
+        log.error("❌ Falha ao salvar dados na planilha. Erro: %s", e, exc_info=_com_traceback())
 
 # --- DEFINIÇÃO DOS AGENTES DE IA (ADK) ---
 
@@ -510,7 +700,7 @@ Após o anel ser destruído, Frodo e Sam esperam o fim entre as cinzas da Montan
 
     description="Seleciona frases famosas e conhecidas da trilogia cinematográfica de 'O Senhor dos Anéis'."
 )
-print(f"🤖 [OKAY] Agente ADK '{sda_citation_agent.name}' (Foco: Frases de Filmes) definido.")
+log.info("🤖 Agente ADK '%s' (Foco: Frases de Filmes) definido.", sda_citation_agent.name)
 
 # Agente para gerar prompts artísticos (ESTILO HQ ANOS 90, CENA AMPLA) baseados nas frases dos filmes
 sda_image_prompt_agent = Agent(
@@ -519,18 +709,17 @@ sda_image_prompt_agent = Agent(
     instruction="INSTRUCAO_BASE_PARA_PROMPT_DE_IMAGEM_HQ_SDA", # Placeholder, será substituída no loop
     description="Cria prompts para imagens no estilo HQ anos 90, com foco em cenas amplas, baseados em frases da trilogia SdA."
 )
-print(f"🤖 [OKAY] Agente ADK '{sda_image_prompt_agent.name}' (Foco: Imagem HQ Anos 90 - Cena Ampla) definido.")
-print("----------------------------------------------------")
+log.info("🤖 Agente ADK '%s' (Foco: Imagem HQ Anos 90 - Cena Ampla) definido.", sda_image_prompt_agent.name)
 
 # --- LÓGICA PRINCIPAL DO SCRIPT (MAIN LOOP) ---
 def main_loop():
     """
     Loop principal de execução do script.
     """
-    print(f"\n🚀 [MAIN] Iniciando Loop Principal do Agente SdA (Frases de Filmes, Imagens HQ Anos 90) 🚀")
+    log.info("🚀 Iniciando Loop Principal do Agente SdA (Frases de Filmes, Imagens HQ Anos 90) 🚀")
     
     if not gsheets_worksheet or not gdrive_service or not gemini_image_generation_client:
-        print("❌ [FATAL] [MAIN] Serviços essenciais não inicializados. Encerrando o loop.")
+        log.critical("❌ Serviços essenciais não inicializados. Encerrando o loop.")
         return 
 
     # Nova instrução base para o agente que gera prompts de imagem (HQ anos 90, CENA AMPLA)
@@ -553,55 +742,57 @@ Retorne apenas o prompt da imagem, sem saudações, explicações ou qualquer te
 
     while True:
         post_counter += 1
+        # Cada post recebe um ID de correlação; os textos completos só são logados em uma amostra dos posts.
+        _post_id_atual.set(f"{post_counter}-{uuid.uuid4().hex[:8]}")
+        _post_amostrado.set(random.random() < LOG_TAXA_AMOSTRAGEM_PAYLOAD)
         current_processing_time_str = datetime.now(pytz.timezone(TIME_ZONE)).strftime("%Y-%m-%d %H:%M:%S")
-        print(f"\n\n🎬 --- [MAIN] Processando Post #{post_counter} (Filmes/HQ90) às {current_processing_time_str} --- 🎬")
-        print("====================================================")
+        log.debug("🎬 Processando Post #%d (Filmes/HQ90) às %s", post_counter, current_processing_time_str)
 
         # ETAPA 1: Gerar Frase Famosa do Filme
         # ------------------------------------
         citation_agent_input = "Por favor, selecione uma frase famosa e impactante da trilogia cinematográfica de O Senhor dos Anéis, seguindo RIGOROSAMENTE suas instruções de formato e autenticidade."
-        print(f"📖 [INFO] [MAIN] Etapa 1: Solicitando frase de filme ao agente '{sda_citation_agent.name}'...")
+        log.debug("📖 Etapa 1: Solicitando frase de filme ao agente '%s'...", sda_citation_agent.name)
         
         generated_citation = call_agent_sync(sda_citation_agent, citation_agent_input)
 
         if not generated_citation or not generated_citation.strip():
-            print(f"❌ [ERROR] [MAIN] Etapa 1: Falha ao gerar frase do filme. Agente '{sda_citation_agent.name}' não retornou conteúdo.")
+            log.error("❌ Etapa 1: Falha ao gerar frase do filme. Agente '%s' não retornou conteúdo.", sda_citation_agent.name)
             save_data_to_google_sheet(gsheets_worksheet, current_processing_time_str, "ERRO SISTEMA: Frase do filme não gerada", "N/A - Falha na Etapa 1")
-            print(f"🕒 [INFO] [MAIN] Aguardando {INTERVALO_ENTRE_POSTS_SEGUNDOS} segundos...")
+            log.debug("🕒 Aguardando %d segundos...", INTERVALO_ENTRE_POSTS_SEGUNDOS)
             time.sleep(INTERVALO_ENTRE_POSTS_SEGUNDOS)
             continue 
-        print(f"💬 [OKAY] [MAIN] Etapa 1: Frase do Filme Gerada:\n--- Frase Gerada ---\n{generated_citation}\n----------------------\n")
+        log_payload("💬 Etapa 1: Frase do Filme Gerada", generated_citation)
 
         # ETAPA 2: Gerar Prompt para Imagem (HQ anos 90)
         # ----------------------------------------------
-        print(f"🎨 [INFO] [MAIN] Etapa 2: Solicitando prompt de imagem (HQ anos 90) ao agente '{sda_image_prompt_agent.name}'...")
+        log.debug("🎨 Etapa 2: Solicitando prompt de imagem (HQ anos 90) ao agente '%s'...", sda_image_prompt_agent.name)
         sda_image_prompt_agent.instruction = base_instruction_for_image_prompt_agent.replace(
             "{TEXTO_DA_FRASE_DO_FILME_AQUI}", generated_citation 
         )
         artistic_image_prompt = call_agent_sync(sda_image_prompt_agent, "Gere o prompt para a imagem no estilo HQ anos 90 com cena ampla, baseado na frase fornecida em sua instrução.")
 
         if not artistic_image_prompt or not artistic_image_prompt.strip():
-            print(f"❌ [ERROR] [MAIN] Etapa 2: Falha ao gerar prompt para imagem HQ. Agente '{sda_image_prompt_agent.name}' não retornou conteúdo.")
+            log.error("❌ Etapa 2: Falha ao gerar prompt para imagem HQ. Agente '%s' não retornou conteúdo.", sda_image_prompt_agent.name)
             save_data_to_google_sheet(gsheets_worksheet, current_processing_time_str, generated_citation, "ERRO SISTEMA: Prompt de imagem HQ não gerado - Falha na Etapa 2")
-            print(f"🕒 [INFO] [MAIN] Aguardando {INTERVALO_ENTRE_POSTS_SEGUNDOS} segundos...")
+            log.debug("🕒 Aguardando %d segundos...", INTERVALO_ENTRE_POSTS_SEGUNDOS)
             time.sleep(INTERVALO_ENTRE_POSTS_SEGUNDOS)
             continue
-        print(f"🖌️ [OKAY] [MAIN] Etapa 2: Prompt artístico (HQ anos 90) gerado.") 
+        log.debug("🖌️ Etapa 2: Prompt artístico (HQ anos 90) gerado.")
         # O prompt da imagem já é logado dentro da função generate_image_with_gemini_client
 
         # ETAPA 3: Gerar Imagem
         # ---------------------
-        print(f"🖼️ [INFO] [MAIN] Etapa 3: Solicitando geração de imagem (formato alvo: JPEG)...")
+        log.debug("🖼️ Etapa 3: Solicitando geração de imagem (formato alvo: JPEG)...")
         generated_jpeg_image_bytes = generate_image_with_gemini_client(artistic_image_prompt)
         
         final_image_url_for_sheet = "ERRO SISTEMA: Status desconhecido do processamento da imagem" 
 
         if generated_jpeg_image_bytes:
-            print(f"✅ [OKAY] [MAIN] Etapa 3: Bytes da imagem (JPEG ou convertida) gerados.")
+            log.debug("✅ Etapa 3: Bytes da imagem (JPEG ou convertida) gerados.")
             
             # ETAPA 4: Upload e Permissões no Google Drive
             # -------------------------------------------
-            print(f"💾 [INFO] [MAIN] Etapa 4: Iniciando upload e permissões no Google Drive...")
+            log.debug("💾 Etapa 4: Iniciando upload e permissões no Google Drive...")
             drive_filename = f"SdA_Filme_HQ90_{datetime.now(pytz.timezone(TIME_ZONE)).strftime('%Y%m%d_%H%M%S')}.jpg" 
             
             _, direct_download_url, uploaded_file_id_on_drive = upload_image_to_google_drive(
@@ -609,37 +800,36 @@ Retorne apenas o prompt da imagem, sem saudações, explicações ou qualquer te
             )
 
             if direct_download_url and uploaded_file_id_on_drive:
-                print(f"🔒 [INFO] [MAIN] Etapa 4a: Definindo permissões públicas para o arquivo ID: {uploaded_file_id_on_drive}...")
+                log.debug("🔒 Etapa 4a: Definindo permissões públicas para o arquivo ID: %s...", uploaded_file_id_on_drive)
                 permissions_set_successfully = set_google_drive_file_public_readable(gdrive_service, uploaded_file_id_on_drive)
                 
                 if permissions_set_successfully:
                     final_image_url_for_sheet = direct_download_url
-                    print(f"✅ [OKAY] [MAIN] Etapa 4: Upload e permissões concluídos. Link: {final_image_url_for_sheet}")
+                    log.debug("✅ Etapa 4: Upload e permissões concluídos. Link: %s", final_image_url_for_sheet)
                 else:
                     final_image_url_for_sheet = f"ERRO SISTEMA: Imagem no Drive ({direct_download_url}) mas FALHA AO DEFINIR PERMISSÕES."
-                    print(f"❌ [ERROR] [MAIN] Etapa 4: {final_image_url_for_sheet}")
+                    log.error("❌ Etapa 4: %s", final_image_url_for_sheet)
             elif uploaded_file_id_on_drive: # Caso raro: upload deu ID mas não link direto (nossa func não faz isso)
                  final_image_url_for_sheet = f"ERRO SISTEMA: Upload ocorreu (ID: {uploaded_file_id_on_drive}), mas falha ao obter link direto."
-                 print(f"❌ [ERROR] [MAIN] Etapa 4: {final_image_url_for_sheet}")
+                 log.error("❌ Etapa 4: %s", final_image_url_for_sheet)
             else: 
                 final_image_url_for_sheet = "ERRO SISTEMA: Falha completa no upload para o Google Drive."
-                print(f"❌ [ERROR] [MAIN] Etapa 4: {final_image_url_for_sheet}")
+                log.error("❌ Etapa 4: %s", final_image_url_for_sheet)
         else:
             error_msg_img = "ERRO SISTEMA: Imagem não gerada ou falha na conversão (bytes vazios)."
             if not artistic_image_prompt or not artistic_image_prompt.strip():
                  error_msg_img += " Causa provável: Prompt artístico estava vazio."
             final_image_url_for_sheet = error_msg_img
-            print(f"❌ [ERROR] [MAIN] Etapa 3: {error_msg_img}")
+            log.error("❌ Etapa 3: %s", error_msg_img)
 
         # ETAPA 5: Registrar Dados na Planilha
         # ------------------------------------
-        print(f"📊 [INFO] [MAIN] Etapa 5: Registrando informações na Planilha Google...")
+        log.debug("📊 Etapa 5: Registrando informações na Planilha Google...")
         save_data_to_google_sheet(gsheets_worksheet, current_processing_time_str, generated_citation, final_image_url_for_sheet)
-        print(f"🏁 [OKAY] [MAIN] Post #{post_counter} (Filmes/HQ90) totalmente processado.")
-        print("====================================================")
-
+        # Única linha INFO de um post: resumo com a prévia da frase e o link (ou o erro) da imagem.
+        log.info("🏁 Post #%d (Filmes/HQ90) processado: '%s' -> %s", post_counter, _previa(generated_citation), final_image_url_for_sheet)
 
-        print(f"🕒 [INFO] [MAIN] Aguardando {INTERVALO_ENTRE_POSTS_SEGUNDOS} segundos antes do próximo post...")
+        log.debug("🕒 Aguardando %d segundos antes do próximo post...", INTERVALO_ENTRE_POSTS_SEGUNDOS)
         time.sleep(INTERVALO_ENTRE_POSTS_SEGUNDOS)
 
 # --- PONTO DE ENTRADA DO SCRIPT ---
@@ -647,9 +837,8 @@ if __name__ == "__main__":
     try:
         main_loop() 
     except KeyboardInterrupt:
-        print("\n🛑 [INFO] Script interrompido pelo usuário (KeyboardInterrupt). Encerrando...")
+        log.info("🛑 Script interrompido pelo usuário (KeyboardInterrupt). Encerrando...")
     except Exception as e_main:
-        print(f"💥 [FATAL] [MAIN] Uma exceção não tratada ocorreu no loop principal: {e_main}")
-        traceback.print_exc()
+        log.critical("💥 Uma exceção não tratada ocorreu no loop principal: %s", e_main, exc_info=True)
     finally:
-        print("🔚 [INFO] Script finalizado.")
+        log.info("🔚 Script finalizado.")